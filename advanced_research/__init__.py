@@ -3,9 +3,11 @@ from advanced_research.main import (
     AdvancedResearchAdditionalConfig,
     execute_worker_search_agents,
 )
+from advanced_research.search_tools import gemini_search_tool_batch
 
 __all__ = [
     "AdvancedResearch",
     "execute_worker_search_agents",
     "AdvancedResearchAdditionalConfig",
+    "gemini_search_tool_batch",
 ]
@@ -1,5 +1,6 @@
 import concurrent.futures
 import os
+import threading
 import uuid
 from datetime import datetime
 from typing import Any, List, Optional
@@ -51,6 +52,7 @@ class TokenTracker:
     """
 
     _instance = None
+    _lock = threading.Lock()
     input_tokens = 0
     output_tokens = 0
     total_tokens = 0
@@ -71,9 +73,11 @@ class TokenTracker:
         try:
             in_count = count_tokens(input_str)
             out_count = count_tokens(output_str)
-            cls.input_tokens += in_count
-            cls.output_tokens += out_count
-            cls.total_tokens += in_count + out_count
+            # Agents run on worker threads, so guard the shared counters
+            with cls._lock:
+                cls.input_tokens += in_count
+                cls.output_tokens += out_count
+                cls.total_tokens += in_count + out_count
             logger.info(
                 f"[{agent_name}] Tokens - Input: {in_count}, Output: {out_count}, Total: {in_count + out_count}"
             )
@@ -197,7 +201,10 @@ def create_json_file(data: dict, file_name: str):
 
     with open(file_name, "wb") as f:
         f.write(
-            orjson.dumps(data_to_write, option=orjson.OPT_INDENT_2)
+            orjson.dumps(
+                data_to_write,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            )
         )
 
 
@@ -292,7 +299,7 @@ def execute_worker_search_agents(
     queries: list[str],
 ) -> str:
     """
-    Executes multiple worker search agents in sequence, each responsible for handling a single research query.
+    Executes multiple worker search agents concurrently, each responsible for handling a single research query.
 
     This function is designed to automate the process of running multiple independent search agents (one per query)
     using the Swarms Agent framework. Each agent is initialized with a custom system prompt tailored to its specific
@@ -318,10 +325,10 @@ def execute_worker_search_agents(
                 - The Exa search tool enabled for web research.
             b. Run the agent with the query as its task.
             c. Collect the agent's output (typically a summary or structured research findings).
-        2. Return a list of all agent outputs.
+        2. Return the agent outputs, in query order, joined into a single string.
 
     Notes:
-        - This function runs agents in parallel using ThreadPoolExecutor to maximize throughput.
+        - This function runs agents in parallel using ThreadPoolExecutor (up to 8 at a time) to maximize throughput.
         - The function assumes that `get_subagent_prompt` and `exa_search` are properly defined and imported.
         - The agent's output format depends on the system prompt and the agent's implementation.
         - Useful for orchestrating multi-query research tasks in advanced research pipelines.
@@ -333,17 +340,19 @@ def execute_worker_search_agents(
         >>> print(results[1])  # Output from the second query's agent
     """
 
+    if not queries:
+        return ""
+
+    # Agents spend their time waiting on LLM and search APIs, so run them
+    # concurrently; executor.map keeps outputs in query order.
     with concurrent.futures.ThreadPoolExecutor(
-        max_workers=os.cpu_count()
+        max_workers=min(len(queries), 8)
     ) as executor:
-        futures = [
-            executor.submit(run_agent, i, query)
-            for i, query in enumerate(queries)
-        ]
-        results = [
-            future.result()
-            for future in concurrent.futures.as_completed(futures)
-        ]
+        results = list(
+            executor.map(
+                lambda iq: run_agent(*iq), enumerate(queries)
+            )
+        )
 
     return " ".join(results)
 
@@ -601,6 +610,33 @@ class AdvancedResearch:
         # Add the initial human task to conversation
         self.conversation.add("human", task)
 
+        # Export once per run instead of rewriting the file after every
+        # loop; partial progress is still exported if a loop fails
+        try:
+            self._run_loops(task, img)
+        except BaseException:
+            self._export_conversation_safely()
+            raise
+        self._export_conversation()
+
+        # Log total token usage
+        stats = TokenTracker.get_stats()
+        logger.info(
+            f"Research Session Complete. Total Token Usage: {stats}"
+        )
+
+        return history_output_formatter(
+            conversation=self.conversation, type=self.output_type
+        )
+
+    def _run_loops(self, task: str, img: Optional[str] = None):
+        """
+        Run the configured number of research loops on a task.
+
+        Args:
+            task (str): The research task to execute.
+            img (Optional[str]): Optional image input.
+        """
         # Run the research system for the specified number of loops
         for loop_num in range(self.max_loops):
             logger.info(
@@ -634,28 +670,101 @@ class AdvancedResearch:
                 f"Completed research loop {loop_num + 1}/{self.max_loops}"
             )
 
-            # If export is enabled, save after each loop
-            if self.export_on:
-                self._export_conversation()
-
-        # Log total token usage
-        stats = TokenTracker.get_stats()
-        logger.info(
-            f"Research Session Complete. Total Token Usage: {stats}"
-        )
-
-        return history_output_formatter(
-            conversation=self.conversation, type=self.output_type
-        )
-
     def batched_run(self, tasks: List[str]):
         """
         Run the research system on a batch of tasks.
 
+        Tasks are independent, so each one runs concurrently in its own session
+        (separate conversation and memory) with this instance's configuration.
+        The conversations and new findings of completed sessions are then
+        merged back into this instance in task order; if a session changed the
+        research plan or phase, the last such change in task order is kept.
+
+        If any task fails, the completed sessions are still merged and exported
+        before the first failure is re-raised.
+
         Args:
             tasks (List[str]): List of research tasks to execute.
+
+        Returns:
+            list: The formatted output of each task, in task order.
+        """
+        if not tasks:
+            return []
+
+        sessions = [self._spawn_session() for _ in tasks]
+        results = [None] * len(tasks)
+        completed = [False] * len(tasks)
+        errors = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(len(tasks), 16)
+        ) as executor:
+            futures = [
+                executor.submit(session.run, task)
+                for session, task in zip(sessions, tasks)
+            ]
+            for index, future in enumerate(futures):
+                try:
+                    results[index] = future.result()
+                    completed[index] = True
+                except Exception as e:
+                    logger.error(
+                        f"Batched task {index + 1}/{len(tasks)} failed: {e}"
+                    )
+                    errors.append(e)
+
+        known_findings = len(self.memory.findings)
+        original_plan = self.memory.plan
+        original_phase = self.memory.current_phase
+        for session, done in zip(sessions, completed):
+            if not done:
+                continue
+            # Copy the stored messages as-is so fields such as timestamps
+            # survive the merge
+            self.conversation.conversation_history.extend(
+                dict(message)
+                for message in session.conversation.conversation_history
+            )
+            self.memory.findings.extend(
+                session.memory.findings[known_findings:]
+            )
+            if session.memory.plan != original_plan:
+                self.memory.plan = session.memory.plan
+            if session.memory.current_phase != original_phase:
+                self.memory.current_phase = (
+                    session.memory.current_phase
+                )
+
+        if errors:
+            self._export_conversation_safely()
+            raise errors[0]
+
+        self._export_conversation()
+        return results
+
+    def _spawn_session(self) -> "AdvancedResearch":
         """
-        [self.run(task) for task in tasks]
+        Create a research session with this instance's configuration and a
+        copy of its memory, used to run one task of a batch in isolation.
+
+        Returns:
+            AdvancedResearch: The new session; it never exports on its own.
+        """
+        session = AdvancedResearch(
+            id=self.id,
+            name=self.name,
+            description=self.description,
+            worker_model_name=self.worker_model_name,
+            director_agent_name=self.director_agent_name,
+            director_model_name=self.director_model_name,
+            director_max_tokens=self.director_max_tokens,
+            output_type=self.output_type,
+            max_loops=self.max_loops,
+            export_on=False,
+            director_max_loops=self.director_max_loops,
+        )
+        session.memory = self.memory.model_copy(deep=True)
+        return session
 
     def _export_conversation(self):
         """
@@ -669,13 +778,23 @@ class AdvancedResearch:
                 "id": self.id,
                 "name": self.name,
                 "description": self.description,
-                "conversation_history": self.conversation.get_history(),
+                "conversation_history": self.conversation.conversation_history,
                 "export_timestamp": datetime.now().isoformat(),
             }
 
             create_json_file(conversation_data, output_file)
             logger.info(f"Conversation exported to {output_file}")
 
+    def _export_conversation_safely(self):
+        """
+        Export the conversation history, logging rather than raising on failure
+        so an export error never hides the exception of a failed research loop.
+        """
+        try:
+            self._export_conversation()
+        except Exception as e:
+            logger.error(f"Failed to export conversation: {e}")
+
     def get_output_methods(self):
         """
         Get the available output formatting methods.
@@ -1,15 +1,276 @@
-import json
+import atexit
+import concurrent.futures
+import functools
+import itertools
 import os
-from typing import Any
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
 
-import requests
+import httpx
+import orjson
+from cachetools import TTLCache
+from cachetools.func import ttl_cache
 from loguru import logger
 
+# Module logger; info calls go through the lazy variant so the query slice
+# is only built when a sink actually accepts the record
+_log = logger.bind(mod="search")
+_lazy_log = _log.opt(lazy=True)
 
+_EMPTY_RESULTS_JSON = orjson.dumps({"results": []}).decode()
+
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=16)
+
+# Shared client so repeated Gemini calls reuse keep-alive connections
+_HTTP = httpx.Client(http2=True, timeout=30, limits=_HTTP_LIMITS)
+atexit.register(_HTTP.close)
+
+
+@functools.singledispatch
 def any_to_str(data: Any) -> str:
     return str(data)
 
 
+@any_to_str.register
+def _(data: str) -> str:
+    return data
+
+
+@any_to_str.register
+def _(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace")
+
+
+@any_to_str.register(dict)
+@any_to_str.register(list)
+def _(data) -> str:
+    try:
+        return orjson.dumps(
+            data, default=str, option=orjson.OPT_NON_STR_KEYS
+        ).decode()
+    except TypeError:
+        return str(data)
+
+
+@dataclass(slots=True)
+class SearchHit:
+    """
+    A single search result, shaped like Exa's result objects so every
+    provider returns the same fields. orjson serializes it natively.
+    """
+
+    title: Optional[str]
+    url: Optional[str]
+    text: str = ""
+    score: float = 0.0
+    id: str = ""
+    publishedDate: str = ""
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache for search results.
+
+    Entries are keyed on ``(provider, query, characters, sources)``. A
+    lookup first tries an exact key match, then falls back to the stored
+    query with the highest cosine similarity among entries sharing the same
+    ``provider``/``characters``/``sources``. Entries are evicted in LRU order and expire
+    ``ttl`` seconds after they were stored.
+
+    Args:
+        model_name (str): Sentence-transformers model used for embeddings.
+        threshold (float): Minimum cosine similarity for a semantic hit.
+        maxsize (int): Maximum number of cached entries.
+        ttl (Optional[float]): Seconds an entry stays valid, or None to keep
+            entries until they are evicted. Matches the DDG result cache.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        threshold: float = 0.95,
+        maxsize: int = 256,
+        ttl: Optional[float] = 600,
+    ):
+        self.model_name = model_name
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._model = None
+        # key -> (embedding, value, stored_at)
+        self._entries: (
+            "OrderedDict[Tuple, Tuple[Any, str, float]]"
+        ) = OrderedDict()
+        self._lock = threading.Lock()
+        # Separate from _lock so lookups aren't blocked while the model loads
+        self._model_lock = threading.Lock()
+
+    def _embed(self, text: str):
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    from sentence_transformers import (
+                        SentenceTransformer,
+                    )
+
+                    self._model = SentenceTransformer(
+                        self.model_name
+                    )
+        return self._model.encode(text, normalize_embeddings=True)
+
+    def _expire(self) -> None:
+        # Entries are stored in insertion order and only moved on hits, so
+        # drop every stale entry rather than stopping at the first fresh one
+        if self.ttl is None:
+            return
+        cutoff = time.monotonic() - self.ttl
+        for key in [
+            key
+            for key, (_, _, stored_at) in self._entries.items()
+            if stored_at <= cutoff
+        ]:
+            del self._entries[key]
+
+    def get_or_compute(
+        self, key: Tuple, compute: Callable[[], str]
+    ) -> str:
+        """
+        Return the cached value for ``key``, calling ``compute`` on a miss.
+
+        Exceptions raised by ``compute`` propagate and nothing is cached.
+        """
+        with self._lock:
+            self._expire()
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key][1]
+
+        embedding = self._embed(key[1])
+        with self._lock:
+            self._expire()
+            best_key, best_score = None, self.threshold
+            for other_key, (other, _, _) in self._entries.items():
+                if (
+                    other_key[0] != key[0]
+                    or other_key[2:] != key[2:]
+                ):
+                    continue
+                score = float(embedding @ other)
+                if score > best_score:
+                    best_key, best_score = other_key, score
+            if best_key is not None:
+                self._entries.move_to_end(best_key)
+                return self._entries[best_key][1]
+
+        value = compute()
+        with self._lock:
+            self._entries[key] = (embedding, value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def _build_semantic_cache() -> Optional[SemanticCache]:
+    if os.getenv("SEARCH_SEMANTIC_CACHE", "false").lower() != "true":
+        return None
+    try:
+        import sentence_transformers  # noqa: F401
+    except ImportError:
+        _log.warning(
+            "SEARCH_SEMANTIC_CACHE is enabled but sentence-transformers is not installed; "
+            "falling back to exact-match caching."
+        )
+        return None
+    return SemanticCache()
+
+
+# Built on the first search rather than at import, so SEARCH_SEMANTIC_CACHE
+# set by load_dotenv() after this module is imported is still honored
+_SEMANTIC_CACHE: Optional[SemanticCache] = None
+_SEMANTIC_CACHE_BUILT = False
+_SEMANTIC_CACHE_LOCK = threading.Lock()
+
+
+def _get_semantic_cache() -> Optional[SemanticCache]:
+    global _SEMANTIC_CACHE, _SEMANTIC_CACHE_BUILT
+    if _SEMANTIC_CACHE is None and not _SEMANTIC_CACHE_BUILT:
+        with _SEMANTIC_CACHE_LOCK:
+            if not _SEMANTIC_CACHE_BUILT:
+                _SEMANTIC_CACHE = _build_semantic_cache()
+                _SEMANTIC_CACHE_BUILT = True
+    return _SEMANTIC_CACHE
+
+
+def _cached_search(
+    search: Callable[[str, int, int], str],
+    query: str,
+    characters: int,
+    sources: int,
+) -> str:
+    cache = _get_semantic_cache()
+    if cache is None:
+        return search(query, characters, sources)
+    # Keyed per provider so one provider never answers for another
+    return cache.get_or_compute(
+        (search.__name__, query, characters, sources),
+        lambda: search(query, characters, sources),
+    )
+
+
+def clear_search_cache() -> None:
+    """
+    Clear all cached search results.
+    """
+    _duckduckgo_search.cache_clear()
+    with _GEMINI_CACHE_LOCK:
+        _GEMINI_CACHE.clear()
+    if _SEMANTIC_CACHE is not None:
+        _SEMANTIC_CACHE.clear()
+
+
+# One DDGS client per worker thread, so its HTTP session is reused across
+# searches without serializing concurrent agents behind a lock
+_DDGS_LOCAL = threading.local()
+
+
+def _get_ddgs():
+    ddgs = getattr(_DDGS_LOCAL, "client", None)
+    if ddgs is None:
+        from duckduckgo_search import DDGS
+
+        ddgs = _DDGS_LOCAL.client = DDGS()
+    return ddgs
+
+
+# Web results go stale, so expire cached DDG searches after 10 minutes
+@ttl_cache(maxsize=512, ttl=600)
+def _duckduckgo_search(
+    query: str, characters: int, sources: int
+) -> str:
+    # ddgs.text yields dicts: {'title':..., 'href':..., 'body':...}.
+    # Format them as they arrive, to look somewhat like Exa's output for
+    # consistency, and stop once `sources` results have been seen.
+    results = _get_ddgs().text(query, max_results=sources)
+    formatted_results = [
+        SearchHit(
+            title=r.get("title"),
+            url=r.get("href"),
+            text=r.get("body", ""),
+        )
+        for r in itertools.islice(results, sources)
+    ]
+
+    return orjson.dumps({"results": formatted_results}).decode()
+
+
 def duckduckgo_search_tool(
     query: str, characters: int = 200, sources: int = 3
 ) -> str:
@@ -21,37 +282,193 @@ def duckduckgo_search_tool(
         characters (int): Not used for DDG but kept for interface compatibility.
         sources (int): Number of results to return.
     """
+    query = query.strip() if query else ""
+    if not query:
+        return _EMPTY_RESULTS_JSON
+
     try:
-        from duckduckgo_search import DDGS
+        from duckduckgo_search import DDGS  # noqa: F401
     except ImportError:
         return "Error: duckduckgo-search package is not installed. Please install it with `pip install duckduckgo-search`."
 
     try:
-        logger.info(f"[DDG SEARCH] Searching for: {query[:50]}...")
-        with DDGS() as ddgs:
-            # ddgs.text returns a generator of dicts: {'title':..., 'href':..., 'body':...}
-            results = list(ddgs.text(query, max_results=sources))
-
-        # Format results to look somewhat like Exa's output for consistency
-        formatted_results = []
-        for r in results:
-            formatted_results.append(
-                {
-                    "title": r.get("title"),
-                    "url": r.get("href"),
-                    "text": r.get("body", ""),
-                    "score": 0.0,
-                    "id": "",
-                    "publishedDate": "",
-                }
-            )
-
-        return json.dumps({"results": formatted_results}, indent=2)
+        _lazy_log.info(
+            "[DDG SEARCH] Searching for: {}...", lambda: query[:50]
+        )
+        return _cached_search(
+            _duckduckgo_search, query, characters, sources
+        )
     except Exception as e:
-        logger.error(f"DuckDuckGo search failed: {e}")
+        _log.error("DuckDuckGo search failed: {}", e)
         return f"Search failed: {str(e)}"
 
 
+# Using gemini-2.5-flash for speed and cost effectiveness
+_GEMINI_URL_TMPL = "https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={}"
+_GEMINI_HEADERS = {"Content-Type": "application/json"}
+_GEMINI_TOOLS = [{"google_search": {}}]
+
+# Read once; a missing key is re-checked on each call since .env files are
+# often loaded after this module is imported
+_GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
+
+def _get_gemini_api_key() -> Optional[str]:
+    global _GEMINI_API_KEY
+    if not _GEMINI_API_KEY:
+        _GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+    return _GEMINI_API_KEY
+
+
+def refresh_api_key() -> None:
+    """
+    Re-read GEMINI_API_KEY from the environment, e.g. after it was changed.
+    """
+    global _GEMINI_API_KEY
+    _GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+
+
+@functools.lru_cache(maxsize=4)
+def _gemini_url(api_key: str) -> str:
+    return _GEMINI_URL_TMPL.format(api_key)
+
+
+# Exact-match Gemini results, shared by the sync and async tools. Grounded
+# answers go stale like DDG results, so they expire on the same schedule
+_GEMINI_CACHE: TTLCache = TTLCache(maxsize=256, ttl=600)
+_GEMINI_CACHE_LOCK = threading.Lock()
+
+
+def _gemini_cache_get(key: Tuple) -> Optional[str]:
+    with _GEMINI_CACHE_LOCK:
+        return _GEMINI_CACHE.get(key)
+
+
+def _gemini_cache_put(key: Tuple, result: str) -> str:
+    with _GEMINI_CACHE_LOCK:
+        _GEMINI_CACHE[key] = result
+    return result
+
+
+def _new_async_http() -> httpx.AsyncClient:
+    # httpx.AsyncClient is bound to the event loop it runs on, so async
+    # clients are never shared at module level; callers own their lifecycle
+    return httpx.AsyncClient(
+        http2=True, timeout=30, limits=_HTTP_LIMITS
+    )
+
+
+def _gemini_payload(query: str) -> bytes:
+    # Encoded with orjson and sent as raw content, instead of letting httpx
+    # run its stdlib json encoder on every request
+    return orjson.dumps(
+        {
+            "contents": [
+                {"parts": [{"text": f"Search for: {query}"}]}
+            ],
+            "tools": _GEMINI_TOOLS,
+        }
+    )
+
+
+def _format_gemini_response(response: httpx.Response) -> str:
+    if response.status_code != 200:
+        _log.error("Gemini API error: {}", response.text)
+        raise RuntimeError(
+            f"Gemini API returned status {response.status_code}"
+        )
+
+    data = orjson.loads(response.content)
+
+    # Extract grounding metadata. Missing (or null) fields fall back to a
+    # shared empty tuple rather than allocating a fresh default per .get
+    candidates = data.get("candidates")
+    if not candidates:
+        return _EMPTY_RESULTS_JSON
+
+    candidate = candidates[0]
+    grounding_metadata = candidate.get("groundingMetadata")
+    chunks = (
+        grounding_metadata.get("groundingChunks") or ()
+        if grounding_metadata
+        else ()
+    )
+
+    formatted_results = []
+    append = formatted_results.append
+
+    # 1. Add the synthesized answer from Gemini as a primary result
+    content = candidate.get("content")
+    parts = (content.get("parts") or ()) if content else ()
+    texts = []
+    for part in parts:
+        if text := part.get("text"):
+            texts.append(text)
+    text_content = "".join(texts)
+
+    if text_content:
+        append(
+            SearchHit(
+                title="Gemini Search Summary",
+                url="google_search_grounding",
+                text=text_content,
+                score=1.0,
+            )
+        )
+
+    # 2. Add the sources as individual results (title/url)
+    for chunk in chunks:
+        if web := chunk.get("web"):
+            append(
+                SearchHit(
+                    title=web.get("title", "Unknown Title"),
+                    url=web.get("uri"),
+                    text="Source referenced in Gemini Grounding",
+                    score=0.8,
+                )
+            )
+
+    return orjson.dumps({"results": formatted_results}).decode()
+
+
+def _gemini_search(query: str, characters: int, sources: int) -> str:
+    key = (query, characters, sources)
+    cached = _gemini_cache_get(key)
+    if cached is not None:
+        return cached
+
+    response = _HTTP.post(
+        _gemini_url(_get_gemini_api_key()),
+        headers=_GEMINI_HEADERS,
+        content=_gemini_payload(query),
+    )
+    return _gemini_cache_put(key, _format_gemini_response(response))
+
+
+async def _gemini_search_async(
+    query: str,
+    characters: int,
+    sources: int,
+    client: Optional[httpx.AsyncClient],
+) -> str:
+    key = (query, characters, sources)
+    cached = _gemini_cache_get(key)
+    if cached is not None:
+        return cached
+
+    request = {
+        "url": _gemini_url(_get_gemini_api_key()),
+        "headers": _GEMINI_HEADERS,
+        "content": _gemini_payload(query),
+    }
+    if client is not None:
+        response = await client.post(**request)
+    else:
+        async with _new_async_http() as owned_client:
+            response = await owned_client.post(**request)
+    return _gemini_cache_put(key, _format_gemini_response(response))
+
+
 def gemini_search_tool(
     query: str, characters: int = 200, sources: int = 3
 ) -> str:
@@ -63,74 +480,103 @@ def gemini_search_tool(
         characters (int): Not used but kept for interface compatibility.
         sources (int): Not directly controllable in grounding (usually ~5-10), kept for interface.
     """
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
+    query = query.strip() if query else ""
+    if not query:
+        return _EMPTY_RESULTS_JSON
+
+    if not _get_gemini_api_key():
         return "Error: GEMINI_API_KEY not found in environment variables."
 
-    # Using gemini-2.5-flash for speed and cost effectiveness
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.5-flash:generateContent?key={api_key}"
+    try:
+        _lazy_log.info(
+            "[GEMINI SEARCH] Searching for: {}...", lambda: query[:50]
+        )
+        return _cached_search(
+            _gemini_search, query, characters, sources
+        )
 
-    payload = {
-        "contents": [{"parts": [{"text": f"Search for: {query}"}]}],
-        "tools": [{"google_search": {}}],
-    }
+    except Exception as e:
+        _log.error("Gemini search failed: {}", e)
+        return f"Search failed: {str(e)}"
 
-    headers = {"Content-Type": "application/json"}
 
-    try:
-        logger.info(f"[GEMINI SEARCH] Searching for: {query[:50]}...")
-        response = requests.post(
-            url, headers=headers, json=payload, timeout=30
-        )
+async def gemini_search_tool_async(
+    query: str,
+    characters: int = 200,
+    sources: int = 3,
+    client: Optional[httpx.AsyncClient] = None,
+) -> str:
+    """
+    Perform a web search using Google Gemini Grounding without blocking the event loop.
 
-        if response.status_code != 200:
-            logger.error(f"Gemini API error: {response.text}")
-            return f"Search failed: Gemini API returned status {response.status_code}"
-
-        data = response.json()
-
-        # Extract grounding metadata
-        candidates = data.get("candidates", [])
-        if not candidates:
-            return json.dumps({"results": []})
-
-        candidate = candidates[0]
-        grounding_metadata = candidate.get("groundingMetadata", {})
-        chunks = grounding_metadata.get("groundingChunks", [])
-
-        formatted_results = []
-
-        # 1. Add the synthesized answer from Gemini as a primary result
-        text_content = ""
-        parts = candidate.get("content", {}).get("parts", [])
-        for part in parts:
-            text_content += part.get("text", "")
-
-        if text_content:
-            formatted_results.append(
-                {
-                    "title": "Gemini Search Summary",
-                    "url": "google_search_grounding",
-                    "text": text_content,
-                    "score": 1.0,
-                }
-            )
+    Shares the exact-match result cache with gemini_search_tool; the
+    optional semantic cache is only consulted by the sync tool.
 
-        # 2. Add the sources as individual results (title/url)
-        for chunk in chunks:
-            web = chunk.get("web")
-            if web:
-                formatted_results.append(
-                    {
-                        "title": web.get("title", "Unknown Title"),
-                        "url": web.get("uri"),
-                        "text": "Source referenced in Gemini Grounding",
-                        "score": 0.8,
-                    }
-                )
+    Args:
+        query (str): The search query.
+        characters (int): Not used but kept for interface compatibility.
+        sources (int): Not directly controllable in grounding (usually ~5-10), kept for interface.
+        client (Optional[httpx.AsyncClient]): Client to send the request with. The caller
+            owns it (e.g. ``async with httpx.AsyncClient(http2=True) as client``) and can
+            reuse it across searches on the same event loop to keep connections warm.
+            When omitted, a client is opened and closed for this call.
+    """
+    query = query.strip() if query else ""
+    if not query:
+        return _EMPTY_RESULTS_JSON
 
-        return json.dumps({"results": formatted_results}, indent=2)
+    if not _get_gemini_api_key():
+        return "Error: GEMINI_API_KEY not found in environment variables."
+
+    try:
+        _lazy_log.info(
+            "[GEMINI SEARCH] Searching for: {}...", lambda: query[:50]
+        )
+        return await _gemini_search_async(
+            query, characters, sources, client
+        )
 
     except Exception as e:
-        logger.error(f"Gemini search failed: {e}")
+        _log.error("Gemini search failed: {}", e)
         return f"Search failed: {str(e)}"
+
+
+def gemini_search_tool_batch(
+    queries: List[str], characters: int = 200, sources: int = 3
+) -> List[str]:
+    """
+    Perform several Google Gemini Grounding searches at once.
+
+    generateContent reads multiple ``contents`` entries as turns of a single
+    conversation and only answers the last one, so the queries are issued
+    concurrently over the shared HTTP/2 client instead. Duplicate queries
+    are searched once.
+
+    Args:
+        queries (List[str]): The search queries.
+        characters (int): Not used but kept for interface compatibility.
+        sources (int): Not directly controllable in grounding, kept for interface.
+
+    Returns:
+        List[str]: One gemini_search_tool result per query, in input order.
+    """
+    unique_queries = list(dict.fromkeys(queries))
+    if not unique_queries:
+        return []
+
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=min(len(unique_queries), 8)
+    ) as executor:
+        results = dict(
+            zip(
+                unique_queries,
+                executor.map(
+                    lambda q: gemini_search_tool(
+                        q, characters, sources
+                    ),
+                    unique_queries,
+                ),
+            )
+        )
+
+    return [results[query] for query in queries]
@@ -2,6 +2,8 @@ import json
 import os
 import sys
 
+import orjson
+
 # Add the project root to sys.path so we can import advanced_research
 sys.path.append(
     os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -23,8 +25,8 @@ result = research_system.run(
 print(json.dumps(result, indent=4))
 
 # Save the result to a JSON file
-with open("garment_simulation_result.json", "w") as f:
-    json.dump(result, f, indent=4)
+with open("garment_simulation_result.json", "wb") as f:
+    f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
 print("Result saved to garment_simulation_result.json")
 
 def save_results_to_markdown(results, filename):
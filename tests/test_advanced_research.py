@@ -4,13 +4,18 @@ Unit tests for main.py - Advanced Research System
 Tests all functions and methods individually without using pytest or unittest
 """
 
+import asyncio
+import functools
 import os
 import tempfile
 from unittest.mock import Mock, patch
 import sys
+import httpx
+import orjson
 from loguru import logger
 
 
+from advanced_research import search_tools
 from advanced_research.main import (
     generate_id,
     create_json_file,
@@ -171,8 +176,9 @@ def test_execute_worker_search_agents(mock_run_agent):
     """Test the execute_worker_search_agents function"""
     logger.info("Testing execute_worker_search_agents...")
 
-    # Mock the run_agent function to return different outputs
-    mock_run_agent.side_effect = ["Output 1", "Output 2", "Output 3"]
+    # Mock the run_agent function to return an output keyed to its index,
+    # since agents run concurrently and may be called in any order
+    mock_run_agent.side_effect = lambda i, query: f"Output {i + 1}"
 
     queries = ["Query 1", "Query 2", "Query 3"]
     result = execute_worker_search_agents(queries)
@@ -182,12 +188,19 @@ def test_execute_worker_search_agents(mock_run_agent):
 
     # Verify the calls were made with correct parameters
     expected_calls = [(0, "Query 1"), (1, "Query 2"), (2, "Query 3")]
-    actual_calls = [call[0] for call in mock_run_agent.call_args_list]
+    actual_calls = sorted(
+        call[0] for call in mock_run_agent.call_args_list
+    )
     assert actual_calls == expected_calls
 
-    # Verify result is concatenated outputs
+    # Verify result is concatenated outputs in query order
     assert result == "Output 1 Output 2 Output 3"
 
+    # An empty query list should not spin up any agents
+    mock_run_agent.reset_mock()
+    assert execute_worker_search_agents([]) == ""
+    mock_run_agent.assert_not_called()
+
     logger.success("✓ execute_worker_search_agents test passed")
 
 
@@ -342,25 +355,138 @@ def test_advanced_research_run(mock_create_director):
     logger.success("✓ AdvancedResearch.run test passed")
 
 
+@patch("advanced_research.main.create_json_file")
+@patch("advanced_research.main.os.makedirs")
+@patch("advanced_research.main.create_director_agent")
+def test_advanced_research_run_export_error(
+    mock_create_director, mock_makedirs, mock_create_json_file
+):
+    """Test that AdvancedResearch.run raises export errors after a successful loop"""
+    logger.info("Testing AdvancedResearch.run export error...")
+
+    mock_create_director.return_value = "Research output"
+    mock_create_json_file.side_effect = OSError("disk full")
+
+    research = AdvancedResearch(export_on=True)
+    try:
+        research.run("Test research task")
+        assert False, "Should have raised the export error"
+    except OSError as e:
+        assert "disk full" in str(e)
+
+    # The loop completed and was exported exactly once
+    assert mock_create_director.call_count == 1
+    mock_create_json_file.assert_called_once()
+
+    logger.success("✓ AdvancedResearch.run export error test passed")
+
+
+def _batched_director(failing=(), **kwargs):
+    """Fake director that records one plan and finding per task and echoes it"""
+    task = kwargs["task"].split("\n")[0]
+    if task in failing:
+        raise RuntimeError("director failed")
+    kwargs["extra_tools"][0](
+        plan=f"Plan for {task}", findings=f"Finding for {task}"
+    )
+    return f"Output for {task}"
+
+
+@patch("advanced_research.main.schema.enable_evaluation", False)
+@patch("advanced_research.main.schema.enable_citation", False)
 @patch("advanced_research.main.create_director_agent")
 def test_advanced_research_batched_run(mock_create_director):
     """Test AdvancedResearch.batched_run method"""
     logger.info("Testing AdvancedResearch.batched_run...")
 
-    mock_create_director.return_value = "Batch output"
+    mock_create_director.side_effect = _batched_director
 
     research = AdvancedResearch()
+    research.memory.findings.append("Existing finding")
     tasks = ["Task 1", "Task 2", "Task 3"]
 
-    # This should not raise an error
-    research.batched_run(tasks)
+    results = research.batched_run(tasks)
 
     # Verify create_director_agent was called for each task
     assert mock_create_director.call_count == 3
 
+    # Outputs, conversation and findings are merged in task order
+    assert results == [f"Output for {task}" for task in tasks]
+    assert research.conversation.conversation_history == [
+        message
+        for task in tasks
+        for message in [
+            {"role": "human", "content": task},
+            {
+                "role": "Director-Agent",
+                "content": f"Output for {task}",
+            },
+        ]
+    ]
+    assert research.memory.findings == [
+        "Existing finding",
+        "Finding for Task 1",
+        "Finding for Task 2",
+        "Finding for Task 3",
+    ]
+    assert research.memory.plan == "Plan for Task 3"
+
+    # An empty batch does nothing
+    assert research.batched_run([]) == []
+
     logger.success("✓ AdvancedResearch.batched_run test passed")
 
 
+@patch("advanced_research.main.schema.enable_evaluation", False)
+@patch("advanced_research.main.schema.enable_citation", False)
+@patch("advanced_research.main.create_json_file")
+@patch("advanced_research.main.os.makedirs")
+@patch("advanced_research.main.create_director_agent")
+def test_advanced_research_batched_run_error(
+    mock_create_director, mock_makedirs, mock_create_json_file
+):
+    """Test AdvancedResearch.batched_run merges and exports completed tasks when one fails"""
+    logger.info("Testing AdvancedResearch.batched_run error path...")
+
+    mock_create_director.side_effect = (
+        lambda **kwargs: _batched_director(
+            failing=("Task 2",), **kwargs
+        )
+    )
+
+    research = AdvancedResearch(export_on=True)
+
+    try:
+        research.batched_run(["Task 1", "Task 2", "Task 3"])
+        assert False, "Should have raised the failed task's error"
+    except RuntimeError as e:
+        assert "director failed" in str(e)
+
+    # The completed tasks are merged in task order, the failed one is dropped
+    assert [
+        message["content"]
+        for message in research.conversation.conversation_history
+    ] == [
+        "Task 1",
+        "Output for Task 1",
+        "Task 3",
+        "Output for Task 3",
+    ]
+    assert research.memory.findings == [
+        "Finding for Task 1",
+        "Finding for Task 3",
+    ]
+
+    # Only the parent exports, once, with the merged history
+    mock_create_json_file.assert_called_once()
+    exported = mock_create_json_file.call_args[0][0]
+    assert len(exported["conversation_history"]) == 4
+
+    logger.success(
+        "✓ AdvancedResearch.batched_run error path test passed"
+    )
+
+
 @patch("advanced_research.main.create_json_file")
 @patch("advanced_research.main.os.makedirs")
 def test_advanced_research_export_conversation(
@@ -446,6 +572,552 @@ def test_advanced_research_additional_config():
     logger.success("✓ AdvancedResearchAdditionalConfig test passed")
 
 
+class _Vector(tuple):
+    """Minimal stand-in for an embedding array: supports `@` as a dot product."""
+
+    def __matmul__(self, other):
+        return sum(a * b for a, b in zip(self, other))
+
+
+def _gemini_response(text="Gemini answer", status_code=200):
+    return httpx.Response(
+        status_code,
+        json={
+            "candidates": [
+                {
+                    "content": {"parts": [{"text": text}]},
+                    "groundingMetadata": {
+                        "groundingChunks": [
+                            {
+                                "web": {
+                                    "title": "Source",
+                                    "uri": "https://a.b",
+                                }
+                            }
+                        ]
+                    },
+                }
+            ]
+        },
+    )
+
+
+def _mock_ddgs():
+    mock_ddgs = Mock()
+    mock_ddgs.text.return_value = [
+        {"title": "Result", "href": "https://a.b", "body": "Body"}
+    ]
+    return mock_ddgs
+
+
+def _with_gemini_test_key(test_func):
+    """Run a test with a fake GEMINI_API_KEY, restoring the cached key afterwards"""
+
+    @functools.wraps(test_func)
+    def wrapper(*args, **kwargs):
+        try:
+            with patch.dict(
+                os.environ, {"GEMINI_API_KEY": "test-key"}
+            ):
+                search_tools.refresh_api_key()
+                return test_func(*args, **kwargs)
+        finally:
+            search_tools.refresh_api_key()
+
+    return wrapper
+
+
+@_with_gemini_test_key
+def test_gemini_search_tool_cache():
+    """Test that gemini_search_tool caches successful results"""
+    logger.info("Testing gemini_search_tool caching...")
+
+    search_tools.clear_search_cache()
+    try:
+        with patch.object(
+            search_tools._HTTP,
+            "post",
+            return_value=_gemini_response(),
+        ) as mock_post:
+            first = search_tools.gemini_search_tool("Cached query")
+            second = search_tools.gemini_search_tool("Cached query")
+
+            # Two identical queries should hit the network once
+            assert mock_post.call_count == 1
+            assert first == second
+            results = orjson.loads(first)["results"]
+            assert results[0]["text"] == "Gemini answer"
+            assert results[1]["url"] == "https://a.b"
+
+            # Clearing the cache forces a new request
+            search_tools.clear_search_cache()
+            search_tools.gemini_search_tool("Cached query")
+            assert mock_post.call_count == 2
+
+            # Entries expire after the TTL like the DDG cache
+            assert search_tools._GEMINI_CACHE.ttl == 600
+            search_tools._GEMINI_CACHE.expire(
+                search_tools._GEMINI_CACHE.timer() + 600
+            )
+            search_tools.gemini_search_tool("Cached query")
+            assert mock_post.call_count == 3
+
+        # Failed searches should not be cached
+        with patch.object(
+            search_tools._HTTP,
+            "post",
+            return_value=_gemini_response(status_code=500),
+        ) as mock_post:
+            result = search_tools.gemini_search_tool("Failing query")
+            assert result.startswith("Search failed")
+            search_tools.gemini_search_tool("Failing query")
+            assert mock_post.call_count == 2
+    finally:
+        search_tools.clear_search_cache()
+
+    logger.success("✓ gemini_search_tool caching test passed")
+
+
+def test_duckduckgo_search_tool_cache():
+    """Test that duckduckgo_search_tool caches results"""
+    logger.info("Testing duckduckgo_search_tool caching...")
+
+    mock_ddgs = _mock_ddgs()
+    search_tools.clear_search_cache()
+    try:
+        with patch.object(
+            search_tools, "_get_ddgs", return_value=mock_ddgs
+        ):
+            first = search_tools.duckduckgo_search_tool(
+                "Cached query"
+            )
+            second = search_tools.duckduckgo_search_tool(
+                "Cached query"
+            )
+
+            # Two identical queries should hit the network once
+            assert mock_ddgs.text.call_count == 1
+            assert first == second
+            assert orjson.loads(first)["results"] == [
+                {
+                    "title": "Result",
+                    "url": "https://a.b",
+                    "text": "Body",
+                    "score": 0.0,
+                    "id": "",
+                    "publishedDate": "",
+                }
+            ]
+
+            # Clearing the cache forces a new search
+            search_tools.clear_search_cache()
+            search_tools.duckduckgo_search_tool("Cached query")
+            assert mock_ddgs.text.call_count == 2
+    finally:
+        search_tools.clear_search_cache()
+
+    logger.success("✓ duckduckgo_search_tool caching test passed")
+
+
+def test_semantic_cache():
+    """Test the SemanticCache class"""
+    logger.info("Testing SemanticCache...")
+
+    embeddings = {
+        "apple pie": _Vector((1.0, 0.0, 0.0)),
+        "apple pies": _Vector((1.0, 0.0, 0.0)),
+        "banana bread": _Vector((0.0, 1.0, 0.0)),
+        "cherry tart": _Vector((0.0, 0.0, 1.0)),
+    }
+    cache = search_tools.SemanticCache(maxsize=2)
+    cache._embed = Mock(side_effect=embeddings.__getitem__)
+    compute = Mock(side_effect=lambda: f"value {compute.call_count}")
+
+    # A miss computes and stores the value
+    assert cache.get_or_compute(
+        ("search", "apple pie", 200, 3), compute
+    ) == ("value 1")
+
+    # An exact hit skips both the embedding and the compute
+    cache._embed.reset_mock()
+    assert cache.get_or_compute(
+        ("search", "apple pie", 200, 3), compute
+    ) == ("value 1")
+    cache._embed.assert_not_called()
+    assert compute.call_count == 1
+
+    # A similar query with the same parameters is a semantic hit
+    assert cache.get_or_compute(
+        ("search", "apple pies", 200, 3), compute
+    ) == ("value 1")
+    assert compute.call_count == 1
+
+    # Different parameters never match semantically
+    assert cache.get_or_compute(
+        ("search", "apple pies", 200, 5), compute
+    ) == ("value 2")
+
+    # A raising compute propagates and caches nothing
+    failing = Mock(side_effect=RuntimeError("boom"))
+    try:
+        cache.get_or_compute(
+            ("search", "banana bread", 200, 3), failing
+        )
+        assert False, "Should have propagated the compute error"
+    except RuntimeError:
+        pass
+    assert cache.get_or_compute(
+        ("search", "banana bread", 200, 3), compute
+    ) == ("value 3")
+
+    # The least recently used entry is evicted once maxsize is exceeded
+    cache.get_or_compute(
+        ("search", "cherry tart", 200, 3), compute
+    )
+    assert ("search", "banana bread", 200, 3) in cache._entries
+    assert ("search", "cherry tart", 200, 3) in cache._entries
+    assert ("search", "apple pies", 200, 5) not in cache._entries
+
+    cache.clear()
+    assert not cache._entries
+
+    logger.success("✓ SemanticCache test passed")
+
+
+@_with_gemini_test_key
+def test_search_tool_semantic_tier():
+    """Test that the search tools consult the semantic cache when enabled"""
+    logger.info("Testing search tool semantic cache tier...")
+
+    cache = search_tools.SemanticCache()
+    cache._embed = Mock(return_value=_Vector((1.0, 0.0)))
+    search_tools.clear_search_cache()
+    try:
+        with patch.object(
+            search_tools, "_SEMANTIC_CACHE", cache
+        ), patch.object(
+            search_tools._HTTP,
+            "post",
+            return_value=_gemini_response(),
+        ) as mock_post:
+            first = search_tools.gemini_search_tool("Latest AI news")
+            second = search_tools.gemini_search_tool("latest AI news")
+
+            # The near-duplicate query is answered from the semantic tier
+            assert mock_post.call_count == 1
+            assert first == second
+
+            # clear_search_cache also empties the semantic tier
+            search_tools.clear_search_cache()
+            assert not cache._entries
+    finally:
+        search_tools.clear_search_cache()
+
+    logger.success("✓ search tool semantic cache tier test passed")
+
+
+@_with_gemini_test_key
+def test_search_tool_semantic_tier_per_provider():
+    """Test that the semantic cache never answers one provider with another's results"""
+    logger.info("Testing search tool semantic cache per provider...")
+
+    cache = search_tools.SemanticCache()
+    cache._embed = Mock(return_value=_Vector((1.0, 0.0)))
+    mock_ddgs = _mock_ddgs()
+    search_tools.clear_search_cache()
+    try:
+        with patch.object(
+            search_tools, "_SEMANTIC_CACHE", cache
+        ), patch.object(
+            search_tools, "_get_ddgs", return_value=mock_ddgs
+        ), patch.object(
+            search_tools._HTTP,
+            "post",
+            return_value=_gemini_response(),
+        ) as mock_post:
+            ddg = search_tools.duckduckgo_search_tool("AI news")
+
+            # Neither the exact nor the similar query reuses the DDG result
+            gemini = search_tools.gemini_search_tool("AI news")
+            assert mock_post.call_count == 1
+            assert gemini != ddg
+            search_tools.gemini_search_tool("ai news")
+            assert mock_post.call_count == 1
+
+            assert search_tools.duckduckgo_search_tool("AI news") == ddg
+            assert mock_ddgs.text.call_count == 1
+    finally:
+        search_tools.clear_search_cache()
+
+    logger.success(
+        "✓ search tool semantic cache per provider test passed"
+    )
+
+
+def test_semantic_cache_built_lazily():
+    """Test that SEARCH_SEMANTIC_CACHE is read on first use, not at import"""
+    logger.info("Testing lazy semantic cache construction...")
+
+    with patch.object(
+        search_tools, "_SEMANTIC_CACHE", None
+    ), patch.object(
+        search_tools, "_SEMANTIC_CACHE_BUILT", False
+    ), patch.dict(
+        sys.modules, {"sentence_transformers": Mock()}
+    ), patch.dict(
+        os.environ, {"SEARCH_SEMANTIC_CACHE": "true"}
+    ):
+        # The flag is set after import, as load_dotenv() does in main
+        cache = search_tools._get_semantic_cache()
+        assert isinstance(cache, search_tools.SemanticCache)
+        assert search_tools._get_semantic_cache() is cache
+
+    with patch.object(
+        search_tools, "_SEMANTIC_CACHE", None
+    ), patch.object(
+        search_tools, "_SEMANTIC_CACHE_BUILT", False
+    ), patch.dict(
+        os.environ, {"SEARCH_SEMANTIC_CACHE": "false"}
+    ):
+        assert search_tools._get_semantic_cache() is None
+
+    logger.success("✓ lazy semantic cache construction test passed")
+
+
+def _echo_gemini_response(url, headers=None, content=None):
+    # Answer each request with its own query so results can be matched up
+    query = orjson.loads(content)["contents"][0]["parts"][0]["text"]
+    return _gemini_response(text=query)
+
+
+@_with_gemini_test_key
+def test_gemini_search_tool_batch():
+    """Test the gemini_search_tool_batch function"""
+    logger.info("Testing gemini_search_tool_batch...")
+
+    search_tools.clear_search_cache()
+    try:
+        with patch.object(
+            search_tools._HTTP,
+            "post",
+            side_effect=_echo_gemini_response,
+        ) as mock_post:
+            queries = ["Query 1", "Query 2", "Query 1", "Query 3"]
+            results = search_tools.gemini_search_tool_batch(queries)
+
+            # Duplicates collapse into a single request each
+            assert mock_post.call_count == 3
+
+            # Results line up with the input order, duplicates included
+            texts = [
+                orjson.loads(result)["results"][0]["text"]
+                for result in results
+            ]
+            assert texts == [f"Search for: {q}" for q in queries]
+
+            # An empty batch makes no requests
+            assert search_tools.gemini_search_tool_batch([]) == []
+            assert mock_post.call_count == 3
+    finally:
+        search_tools.clear_search_cache()
+
+    logger.success("✓ gemini_search_tool_batch test passed")
+
+
+def test_semantic_cache_ttl():
+    """Test that SemanticCache entries expire after their TTL"""
+    logger.info("Testing SemanticCache TTL...")
+
+    cache = search_tools.SemanticCache(ttl=600)
+    cache._embed = Mock(return_value=_Vector((1.0, 0.0)))
+    compute = Mock(side_effect=lambda: f"value {compute.call_count}")
+
+    with patch.object(search_tools, "time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        cache.get_or_compute(("search", "DDG query", 200, 3), compute)
+
+        # Still fresh just before the TTL runs out
+        mock_time.monotonic.return_value = 1599.0
+        assert cache.get_or_compute(
+            ("search", "DDG query", 200, 3), compute
+        ) == ("value 1")
+        assert cache.get_or_compute(
+            ("search", "ddg query", 200, 3), compute
+        ) == ("value 1")
+
+        # Stale entries answer neither exact nor semantic lookups
+        mock_time.monotonic.return_value = 1600.0
+        assert cache.get_or_compute(
+            ("search", "ddg query", 200, 3), compute
+        ) == ("value 2")
+        assert ("search", "DDG query", 200, 3) not in cache._entries
+
+    logger.success("✓ SemanticCache TTL test passed")
+
+
+def test_any_to_str():
+    """Test the any_to_str function"""
+    logger.info("Testing any_to_str...")
+
+    # str is returned as-is
+    text = "already a string"
+    assert search_tools.any_to_str(text) is text
+
+    # bytes are decoded, replacing invalid UTF-8
+    assert search_tools.any_to_str("café".encode()) == "café"
+    assert search_tools.any_to_str(b"bad \xff") == "bad �"
+
+    # dicts and lists become compact JSON, including non-str keys
+    assert (
+        search_tools.any_to_str({"a": [1, 2], 3: None})
+        == '{"a":[1,2],"3":null}'
+    )
+
+    # Non-serializable objects inside containers are rendered with str()
+    class Custom:
+        def __str__(self):
+            return "custom"
+
+    assert search_tools.any_to_str([1, Custom()]) == '[1,"custom"]'
+
+    # Containers orjson cannot encode fall back to str()
+    assert search_tools.any_to_str([2**70]) == str([2**70])
+
+    # Any other type falls back to str()
+    assert search_tools.any_to_str(42) == "42"
+    assert search_tools.any_to_str(None) == "None"
+    assert search_tools.any_to_str((1, 2)) == "(1, 2)"
+
+    logger.success("✓ any_to_str test passed")
+
+
+@_with_gemini_test_key
+def test_gemini_search_tool_async():
+    """Test gemini_search_tool_async across separate event loops"""
+    logger.info("Testing gemini_search_tool_async...")
+
+    def handler(request):
+        return _echo_gemini_response(
+            str(request.url), content=request.content
+        )
+
+    created_clients = []
+
+    def new_client():
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        )
+        created_clients.append(client)
+        return client
+
+    search_tools.clear_search_cache()
+    try:
+        with patch.object(
+            search_tools, "_new_async_http", side_effect=new_client
+        ):
+            # Each asyncio.run uses its own loop; neither may leak a client
+            first = asyncio.run(
+                search_tools.gemini_search_tool_async("Loop 1")
+            )
+            second = asyncio.run(
+                search_tools.gemini_search_tool_async("Loop 2")
+            )
+            assert (
+                orjson.loads(first)["results"][0]["text"]
+                == "Search for: Loop 1"
+            )
+            assert (
+                orjson.loads(second)["results"][0]["text"]
+                == "Search for: Loop 2"
+            )
+            assert len(created_clients) == 2
+            assert all(client.is_closed for client in created_clients)
+
+            # Cached queries do not open a client at all
+            asyncio.run(
+                search_tools.gemini_search_tool_async("Loop 1")
+            )
+            assert len(created_clients) == 2
+
+            # A caller-owned client is used as-is and left open
+            async def search_with_own_client():
+                async with httpx.AsyncClient(
+                    transport=httpx.MockTransport(handler)
+                ) as client:
+                    result = (
+                        await search_tools.gemini_search_tool_async(
+                            "Own client", client=client
+                        )
+                    )
+                    assert not client.is_closed
+                    return result
+
+            result = asyncio.run(search_with_own_client())
+            assert (
+                orjson.loads(result)["results"][0]["text"]
+                == "Search for: Own client"
+            )
+            assert len(created_clients) == 2
+    finally:
+        search_tools.clear_search_cache()
+
+    logger.success("✓ gemini_search_tool_async test passed")
+
+
+@_with_gemini_test_key
+def test_search_tools_empty_query():
+    """Test that empty queries short-circuit before any network I/O"""
+    logger.info("Testing search tools with empty queries...")
+
+    mock_ddgs = _mock_ddgs()
+    search_tools.clear_search_cache()
+    try:
+        with patch.object(
+            search_tools, "_get_ddgs", return_value=mock_ddgs
+        ), patch.object(
+            search_tools._HTTP,
+            "post",
+            return_value=_gemini_response(),
+        ) as mock_post, patch.object(
+            search_tools, "_new_async_http"
+        ) as mock_new_async_http:
+            for query in ["", "   ", "\n\t", None]:
+                assert (
+                    search_tools.duckduckgo_search_tool(query)
+                    == search_tools._EMPTY_RESULTS_JSON
+                )
+                assert (
+                    search_tools.gemini_search_tool(query)
+                    == search_tools._EMPTY_RESULTS_JSON
+                )
+                assert (
+                    asyncio.run(
+                        search_tools.gemini_search_tool_async(query)
+                    )
+                    == search_tools._EMPTY_RESULTS_JSON
+                )
+
+            mock_ddgs.text.assert_not_called()
+            mock_post.assert_not_called()
+            mock_new_async_http.assert_not_called()
+
+            # Surrounding whitespace is stripped before searching
+            search_tools.duckduckgo_search_tool("  padded query  ")
+            mock_ddgs.text.assert_called_once_with(
+                "padded query", max_results=3
+            )
+            search_tools.gemini_search_tool("  padded query  ")
+            sent = orjson.loads(mock_post.call_args[1]["content"])
+            assert (
+                sent["contents"][0]["parts"][0]["text"]
+                == "Search for: padded query"
+            )
+    finally:
+        search_tools.clear_search_cache()
+
+    logger.success("✓ search tools empty query test passed")
+
+
 def run_all_tests():
     """Run all unit tests"""
     logger.info("=" * 60)
@@ -462,10 +1134,23 @@ def run_all_tests():
         test_advanced_research_initialization,
         test_advanced_research_step,
         test_advanced_research_run,
+        test_advanced_research_run_export_error,
         test_advanced_research_batched_run,
+        test_advanced_research_batched_run_error,
         test_advanced_research_export_conversation,
         test_advanced_research_get_output_methods,
         test_advanced_research_additional_config,
+        test_gemini_search_tool_cache,
+        test_duckduckgo_search_tool_cache,
+        test_semantic_cache,
+        test_search_tool_semantic_tier,
+        test_search_tool_semantic_tier_per_provider,
+        test_semantic_cache_built_lazily,
+        test_gemini_search_tool_batch,
+        test_semantic_cache_ttl,
+        test_any_to_str,
+        test_gemini_search_tool_async,
+        test_search_tools_empty_query,
     ]
 
     passed = 0